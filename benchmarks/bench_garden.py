@@ -0,0 +1,689 @@
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterator
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SPECIES: list[str] = [
+    "tomato", "rose", "lettuce", "carrots", "basil", "sunflower", "tulip",
+    "lavender", "mint", "orchid", "cactus", "fern", "pepper", "cucumber",
+    "Blue Spider Lily", "Sakora", "daisy", "ivy", "bamboo", "aloe",
+]
+
+DEFAULT_SCALES: list[int] = [1_000, 10_000, 100_000]
+
+EXERCISES: list[str] = [
+    "ex0/ft_first_exception.py",
+    "ex1/ft_different_errors.py",
+    "ex2/ft_custom_errors.py",
+    "ex3/ft_finally_block.py",
+    "ex4/ft_raise_errors.py",
+    "ex5/ft_garden_management.py",
+]
+
+
+def load_exercise(relative_path: str) -> ModuleType:
+    """
+    Import an exercise file by path, since the ex* folders are not packages.
+
+    Args:
+        relative_path (str): Path of the exercise file from the repo root.
+
+    Returns:
+        ModuleType: The freshly imported module.
+    """
+    path = ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load exercise module: '{relative_path}'.")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def gen_temperatures(n: int, seed: int) -> Iterator[str]:
+    """Yield n temperature strings, mixing valid, out-of-range and junk."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        roll = rng.random()
+        if roll < 0.8:
+            yield str(rng.randint(0, 40))
+        elif roll < 0.95:
+            yield str(rng.randint(-60, 120))
+        else:
+            yield rng.choice(["abc", "", "12.5", "twenty"])
+
+
+def gen_plant_names(n: int, seed: int) -> Iterator[str]:
+    """Yield n plant names drawn from the species list."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield rng.choice(SPECIES)
+
+
+def gen_readings(n: int, seed: int) -> Iterator[tuple[int, int]]:
+    """Yield n (water_level, sunlight_hours) pairs, mostly in safe range."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield rng.randint(0, 12), rng.randint(0, 14)
+
+
+def gen_plants(
+        n: int, seed: int
+) -> Iterator[tuple[str, int, int, int, int]]:
+    """Yield n valid (name, height, age, water_level, sunlight_hours)."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield (rng.choice(SPECIES), rng.randint(1, 600),
+               rng.randint(1, 3000), rng.randint(1, 10), rng.randint(2, 12))
+
+
+def gen_species_names(n: int, seed: int) -> list[str]:
+    """
+    Return n names drawn from 300 species with a Zipf-like distribution.
+
+    A few species make up most of a real inventory. The names are rebuilt
+    from one joined string so that, as when read from a file, every entry
+    is a separate string object.
+    """
+    rng = random.Random(seed)
+    vocabulary = [
+        f"{kind} {variety}"
+        for kind in ["rose", "tomato", "basil", "tulip", "fern", "mint",
+                     "pepper", "lily", "orchid", "daisy"]
+        for variety in [f"variety {index}" for index in range(30)]
+    ]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    picks = rng.choices(vocabulary, weights, k=n)
+    return "\n".join(picks).split("\n")
+
+
+def gen_unique_names(n: int, seed: int) -> list[str]:
+    """
+    Return n distinct cultivar names in random order.
+
+    This is the unbounded vocabulary case: no name repeats, so every call
+    to a name cache misses and the cache keeps evicting.
+    """
+    rng = random.Random(seed)
+    names = [f"{rng.choice(SPECIES).lower()} cultivar {index}"
+             for index in range(n)]
+    rng.shuffle(names)
+    return names
+
+
+def gen_garden_plants(n: int, seed: int) -> list:
+    """Return n garden Plants whose readings cover both safe and bad values."""
+    from garden import Plant
+
+    rng = random.Random(seed)
+    return [
+        Plant(rng.choice(SPECIES), rng.randint(1, 600), rng.randint(1, 3000),
+              rng.randint(0, 14), rng.randint(0, 16))
+        for _ in range(n)
+    ]
+
+
+def baseline_plants_is_health(water_level: int, sunlight_hours: int) -> None:
+    """The ex5 health check as it was before the verdict table, verbatim."""
+    from garden import SunLightError, WaterError
+
+    if water_level > 10:
+        raise WaterError(f"Oversaturation: Water level {water_level} "
+                         "exceeds safety limit (max 10).")
+    if water_level < 1:
+        raise WaterError(f"Dehydration: Water level {water_level} "
+                         "is below survival limit (min 1).")
+    if sunlight_hours > 12:
+        raise SunLightError(f"Overexposure: {sunlight_hours}h "
+                            "sunlight exceeds limit (max 12h).")
+    if sunlight_hours < 2:
+        raise SunLightError(f"Light Deficiency: {sunlight_hours}h "
+                            "is below metabolic limit (min 2h).")
+
+
+def check_verdict_parity() -> None:
+    """
+    Check health_verdict against the baseline ex5 messages.
+
+    Int pairs are asked first so they fill the table, then float and bool
+    pairs that compare equal to those ints, which must not reuse them.
+
+    Raises:
+        RuntimeError: On the first pair whose verdict differs.
+    """
+    from garden import GardenError, health_verdict
+
+    readings = [(water, sun) for water in range(-3, 40)
+                for sun in range(-3, 30)]
+    readings += [(10**9, 3), (-10**9, 3)]
+    readings += [(float(water), sun) for water, sun in readings]
+    readings += [(water, float(sun)) for water, sun in readings]
+    readings += [(True, 5), (False, 5), (5, True), (5, False), (5.5, 8)]
+    for water, sun in readings:
+        try:
+            baseline_plants_is_health(water, sun)
+        except GardenError as error:
+            expected = (error.__class__, str(error))
+        else:
+            expected = None
+        if health_verdict(water, sun) != expected:
+            raise RuntimeError(f"Verdict mismatch for ({water!r}, {sun!r}).")
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak traced allocation, in bytes, of one call to func."""
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def run_timed(
+        func: Callable[[], object], warmup: int, repeat: int
+) -> dict[str, float]:
+    """
+    Time a callable with its stdout sent to /dev/null.
+
+    Args:
+        func (Callable): The zero-argument workload to measure.
+        warmup (int): Number of untimed runs before measuring.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict[str, float]: min, median and mean wall time in seconds.
+    """
+    timings: list[float] = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(warmup):
+            func()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+    }
+
+
+def import_time(relative_path: str) -> float:
+    """
+    Measure the cumulative import time of an exercise with -X importtime.
+
+    The module is imported in a fresh interpreter from its own folder, the
+    same way the exercise is started from the command line.
+
+    Args:
+        relative_path (str): Path of the exercise file from the repo root.
+
+    Returns:
+        float: Cumulative import time of the module in seconds.
+    """
+    path = ROOT / relative_path
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {path.stem}"],
+        cwd=path.parent, capture_output=True, text=True, check=True
+    )
+    for line in completed.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == path.stem:
+            return int(fields[1]) / 1_000_000
+    raise RuntimeError(f"No import time reported for '{relative_path}'.")
+
+
+def bench_imports(warmup: int, repeat: int) -> dict[str, dict[str, float]]:
+    """Time the import of every exercise, with the run_timed statistics."""
+    results: dict[str, dict[str, float]] = {}
+    for relative_path in EXERCISES:
+        for _ in range(warmup):
+            import_time(relative_path)
+        timings = [import_time(relative_path) for _ in range(repeat)]
+        results[f"import.{relative_path.split('/')[0]}"] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.fmean(timings),
+        }
+    return results
+
+
+def bench_replication(rate: int, seconds: float, seed: int) -> dict:
+    """
+    Replicate an ex5 garden to a follower process at a fixed mutation rate.
+
+    Mutations are 10% plant additions, 70% plant updates and 20% water
+    refills. Lag is the time from the oldest mutation of a batch to the
+    follower's acknowledgement of that batch, read by a thread of its own.
+    The leader never flushes the feed itself: batches left over when it
+    goes idle are sent by the feed's flusher thread, so their lag is part
+    of the measurement.
+
+    Args:
+        rate (int): Target number of mutations per second.
+        seconds (float): How long the leader keeps mutating.
+        seed (int): Seed of the mutation generator.
+
+    Returns:
+        dict: Throughput, lag statistics (None when no batch was sent)
+            and whether the follower ended with the leader's plant count
+            and water stock.
+    """
+    import threading
+    from multiprocessing import Pipe, Process
+
+    from garden.replication import ChangeFeed, follow, read_ack
+
+    ex5 = load_exercise("ex5/ft_garden_management.py")
+    rng = random.Random(seed)
+    leader_conn, follower_conn = Pipe()
+    follower = Process(target=follow, args=(follower_conn, None, True))
+    follower.start()
+    follower_conn.close()
+
+    batch_start = 0.0
+    sent: dict[int, float] = {}
+    sent_lock = threading.Lock()
+    sent_bytes = 0
+    lags: list[float] = []
+    acked = (0, 0, 0)
+
+    def send(data: bytes) -> None:
+        nonlocal sent_bytes
+        if data:
+            with sent_lock:
+                sent[feed.sequence] = batch_start
+            sent_bytes += len(data)
+        leader_conn.send_bytes(data)
+
+    def collect() -> None:
+        nonlocal acked
+        while True:
+            try:
+                data = leader_conn.recv_bytes()
+            except EOFError:
+                return
+            acked = read_ack(data)
+            now = time.perf_counter()
+            with sent_lock:
+                for sequence in [key for key in sent if key <= acked[0]]:
+                    lags.append(now - sent.pop(sequence))
+
+    garden = ex5.GardenManager("Konoha", "Naruto", 0)
+    feed = ChangeFeed(send)
+    garden.feed = feed
+    reader = threading.Thread(target=collect)
+    reader.start()
+    done = 0
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        while True:
+            now = time.perf_counter()
+            if now - start >= seconds:
+                break
+            due = int((now - start) * rate)
+            if done >= due:
+                time.sleep(0.0002)
+                continue
+            while done < due:
+                if feed.pending == 0:
+                    batch_start = time.perf_counter()
+                roll = rng.random()
+                if roll < 0.1 or not garden.plants:
+                    garden.add_plant(ex5.Plant(*next(gen_plants(1, done))))
+                elif roll < 0.8:
+                    index = rng.randrange(len(garden.plants))
+                    attribute = rng.choice(["water_level", "sunlight_hours"])
+                    garden.update_plant(index, attribute, rng.randint(1, 10))
+                else:
+                    garden.add_water(rng.randint(1, 5))
+                done += 1
+        elapsed = time.perf_counter() - start
+        feed.close()
+    follower.join()
+    reader.join()
+
+    lags.sort()
+    result = {
+        "mutations": done,
+        "mutations_per_second": round(done / elapsed),
+        "batches": len(lags),
+        "bytes": sent_bytes,
+        "min": None,
+        "median": None,
+        "mean": None,
+        "p99": None,
+        "max": None,
+        "in_sync": acked == (feed.sequence, garden.number_plants,
+                             garden.water_stock),
+    }
+    if lags:
+        result.update({
+            "min": lags[0],
+            "median": statistics.median(lags),
+            "mean": statistics.fmean(lags),
+            "p99": lags[int(len(lags) * 0.99)],
+            "max": lags[-1],
+        })
+    return result
+
+
+def bench_demos() -> dict[str, Callable[[], Callable[[], object]]]:
+    """Return factories for the hardcoded demo harness of every exercise."""
+    ex0 = load_exercise("ex0/ft_first_exception.py")
+    ex1 = load_exercise("ex1/ft_different_errors.py")
+    ex2 = load_exercise("ex2/ft_custom_errors.py")
+    ex3 = load_exercise("ex3/ft_finally_block.py")
+    ex4 = load_exercise("ex4/ft_raise_errors.py")
+    ex5 = load_exercise("ex5/ft_garden_management.py")
+    return {
+        "demo.ex0.test_temperature_input":
+            lambda: ex0.test_temperature_input,
+        "demo.ex1.test_error_types": lambda: ex1.test_error_types,
+        "demo.ex2.main": lambda: ex2.main,
+        "demo.ex3.test_watering_system": lambda: ex3.test_watering_system,
+        "demo.ex4.test_plant_checks": lambda: ex4.test_plant_checks,
+        "demo.ex5.test_garden_management":
+            lambda: ex5.test_garden_management,
+    }
+
+
+def bench_scaled(
+        n: int, seed: int
+) -> dict[str, Callable[[], Callable[[], object]]]:
+    """
+    Return factories for the workloads scaled to n temperatures or plants.
+
+    Each factory generates its input once and returns the callable to time,
+    so only the exercise code is measured and at most one data set is held
+    in memory at a time.
+    """
+    ex0 = load_exercise("ex0/ft_first_exception.py")
+    ex2 = load_exercise("ex2/ft_custom_errors.py")
+    ex3 = load_exercise("ex3/ft_finally_block.py")
+    ex4 = load_exercise("ex4/ft_raise_errors.py")
+    ex5 = load_exercise("ex5/ft_garden_management.py")
+
+    def check_temperatures() -> Callable[[], object]:
+        temperatures = list(gen_temperatures(n, seed))
+
+        def run() -> None:
+            for temp in temperatures:
+                try:
+                    ex0.check_temperature(temp)
+                except ValueError:
+                    pass
+        return run
+
+    def build_ex2_garden() -> Callable[[], object]:
+        records = list(gen_plants(n, seed))
+
+        def run() -> None:
+            garden = ex2.GardenManagement("Hamid", n)
+            for name, height, age, _, _ in records:
+                garden.add_plant(ex2.Plant(name, height, age))
+            garden.watering_garden()
+        return run
+
+    def water_names() -> Callable[[], object]:
+        names = list(gen_plant_names(n, seed))
+        return lambda: ex3.water_plants(names)
+
+    def check_readings() -> Callable[[], object]:
+        names = list(gen_plant_names(n, seed))
+        readings = list(gen_readings(n, seed))
+
+        def run() -> None:
+            for name, (water, sun) in zip(names, readings):
+                try:
+                    ex4.check_plant_health(name, water, sun)
+                except ValueError:
+                    pass
+        return run
+
+    def manage_ex5_garden() -> Callable[[], object]:
+        records = list(gen_plants(n, seed))
+
+        def run() -> None:
+            garden = ex5.GardenManager("Konoha", "Naruto", 2 * n)
+            for record in records:
+                garden.add_plant(ex5.Plant(*record))
+            garden.water_plants()
+            garden.check_water_tank()
+            garden.check_plant_health()
+        return run
+
+    def capitalize_names() -> Callable[[], object]:
+        names = gen_species_names(n, seed)
+        return lambda: [name.capitalize() for name in names]
+
+    def normalize_names() -> Callable[[], object]:
+        from garden import canonical_name
+
+        names = gen_species_names(n, seed)
+        return lambda: [canonical_name(name) for name in names]
+
+    def capitalize_unique_names() -> Callable[[], object]:
+        names = gen_unique_names(n, seed)
+        return lambda: [name.capitalize() for name in names]
+
+    def normalize_unique_names() -> Callable[[], object]:
+        from garden import canonical_name
+
+        names = gen_unique_names(n, seed)
+        return lambda: [canonical_name(name) for name in names]
+
+    def check_each_plant() -> Callable[[], object]:
+        from garden import GardenError
+
+        plants = gen_garden_plants(n, seed)
+
+        def run() -> dict:
+            counts: dict = {}
+            for plant in plants:
+                try:
+                    baseline_plants_is_health(plant.water_level,
+                                              plant.sunlight_hours)
+                except GardenError as error:
+                    verdict: object = str(error)
+                else:
+                    verdict = None
+                counts[verdict] = counts.get(verdict, 0) + 1
+            return counts
+        return run
+
+    def group_plants() -> Callable[[], object]:
+        from garden import group_by_verdict
+
+        check_verdict_parity()
+        plants = gen_garden_plants(n, seed)
+        return lambda: group_by_verdict(plants)
+
+    return {
+        f"ex0.check_temperature[n={n}]": check_temperatures,
+        f"ex2.garden_management[n={n}]": build_ex2_garden,
+        f"ex3.water_plants[n={n}]": water_names,
+        f"ex4.check_plant_health[n={n}]": check_readings,
+        f"ex5.garden_manager[n={n}]": manage_ex5_garden,
+        f"names.capitalize[n={n}]": capitalize_names,
+        f"names.canonical_name[n={n}]": normalize_names,
+        f"names.capitalize_unique[n={n}]": capitalize_unique_names,
+        f"names.canonical_name_unique[n={n}]": normalize_unique_names,
+        f"health.baseline[n={n}]": check_each_plant,
+        f"health.group_by_verdict[n={n}]": group_plants,
+    }
+
+
+def compare(
+        results: dict[str, dict[str, float]],
+        baseline: dict[str, dict[str, float]],
+        threshold: float
+) -> list[str]:
+    """
+    List the benchmarks whose median got slower than the baseline allows.
+
+    Args:
+        results (dict): Current results keyed by benchmark name.
+        baseline (dict): Stored results keyed by benchmark name.
+        threshold (float): Allowed relative slowdown (0.10 means 10%).
+
+    Returns:
+        list[str]: One human-readable line per regression.
+    """
+    regressions: list[str] = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median"]
+        after = current["median"]
+        if before is None or after is None:
+            continue
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append(
+                f"{name}: {before:.6f}s -> {after:.6f}s "
+                f"(+{(after / before - 1) * 100:.1f}%)"
+            )
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark every exercise entry point."
+    )
+    parser.add_argument(
+        "--scales", default=",".join(str(n) for n in DEFAULT_SCALES),
+        help="comma separated input sizes (e.g. 1000,1000000,10000000)"
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--only", default="",
+        help="only run benchmarks whose name contains this text"
+    )
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="also record the peak traced memory of each workload"
+    )
+    parser.add_argument(
+        "--import-time", action="store_true",
+        help="also measure the import time of every exercise"
+    )
+    parser.add_argument(
+        "--replication", type=int, default=0, metavar="RATE",
+        help="also replicate a garden at RATE mutations per second"
+    )
+    parser.add_argument(
+        "--replication-seconds", type=float, default=5.0,
+        help="duration of the replication benchmark (default 5)"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None,
+        help="write results as JSON to this file"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=None,
+        help="JSON results file to compare against"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="allowed slowdown against the baseline (default 0.10)"
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be >= 1 and --warmup >= 0")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the selected benchmarks and return the process exit status."""
+    args = parse_args(argv)
+    scales = [int(n) for n in args.scales.split(",") if n]
+
+    groups: list[tuple[str, Callable[[], dict]]] = [("demos", bench_demos)]
+    for n in scales:
+        groups.append((f"n={n}", lambda n=n: bench_scaled(n, args.seed)))
+
+    results: dict[str, dict[str, float]] = {}
+    for label, build in groups:
+        print(f"=== Benchmarks ({label}) ===", file=sys.stderr)
+        for name, factory in build().items():
+            if args.only not in name:
+                continue
+            func = factory()
+            results[name] = run_timed(func, args.warmup, args.repeat)
+            line = f"{name:<45} median {results[name]['median']:.6f}s"
+            if args.memory:
+                results[name]["peak_bytes"] = peak_memory(func)
+                line += f"  peak {results[name]['peak_bytes']} B"
+            print(line, file=sys.stderr)
+
+    if args.import_time:
+        print("=== Benchmarks (imports) ===", file=sys.stderr)
+        for name, timing in bench_imports(args.warmup, args.repeat).items():
+            if args.only not in name:
+                continue
+            results[name] = timing
+            print(f"{name:<45} median {timing['median']:.6f}s",
+                  file=sys.stderr)
+
+    if args.replication > 0:
+        name = f"replication[rate={args.replication}]"
+        print("=== Benchmarks (replication) ===", file=sys.stderr)
+        results[name] = bench_replication(
+            args.replication, args.replication_seconds, args.seed
+        )
+        replication = results[name]
+        lag = "no batch sent"
+        if replication["median"] is not None:
+            lag = (f"lag median {replication['median']:.6f}s "
+                   f"p99 {replication['p99']:.6f}s")
+        print(f"{name:<45} {replication['mutations_per_second']} "
+              f"mutations/s, {lag}, in sync: {replication['in_sync']}",
+              file=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION - {line}", file=sys.stderr)
+    if not regressions:
+        print("No regression against baseline.", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
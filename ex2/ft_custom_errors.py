@@ -1,63 +1,13 @@
-class GardenError(Exception):
-    """Base class for all garden-related errors."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: GardenError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class PlantError(GardenError):
-    """Raised when there is an issue with a plant."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: PlantError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class WaterError(GardenError):
-    """Raised when there is a watering or irrigation issue."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: WaterError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class Plant:
-    """
-    A class representing a plant with growth and health monitoring.
+import os
+import sys
 
-    Attributes:
-        name (str): The common name of the plant.
-        height (int): The current height of the plant in centimeters.
-        age (int): The age of the plant in days.
-    """
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-    def __init__(self, name: str, height: int, age: int) -> None:
-        """Initialize plant attributes and validate biological constraints."""
-        if name == "":
-            raise PlantError("Validation Failed: Plant identity is missing. "
-                             "Name cannot be an empty string.")
-        if age == 0 and height > 0:
-            raise PlantError("Biological Inconsistency: A newborn plant "
-                             "(age 0) cannot have a positive height.")
-        if age < 0:
-            raise PlantError(f"Invalid Age: {age} days. Age cannot be "
-                             "negative.")
-        if height < 0:
-            raise PlantError(f"Invalid Height: {height} cm. Height cannot be "
-                             "negative.")
-        self.name = name.capitalize()
-        self.age = age
-        self.height = height
-
-    def check_plant_health(self, is_wilting: bool) -> None:
-        """Check if the plant shows signs of distress."""
-        if is_wilting:
-            raise PlantError(f"Health Alert: The {self.name.lower()} "
-                             "is wilting! Immediate care required.")
+from garden import (  # noqa: E402
+    GardenError, Plant, PlantError, WaterError, canonical_name
+)
 
 
 class GardenManagement:
@@ -77,7 +27,7 @@ class GardenManagement:
         if water_stock < 0:
             raise WaterError(f"Tank Error: {water_stock} units is invalid. "
                              "Water levels cannot be negative.")
-        self.owner = owner.capitalize()
+        self.owner = canonical_name(owner)
         self.plants: list[Plant] = []
         self.number_plants = 0
         self.water_stock = water_stock
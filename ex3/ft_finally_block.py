@@ -1,18 +1,11 @@
-def obj_in_class(obj: object, class_name: str) -> bool:
-    """
-    Check if an object is an instance of a specific class by its name.
+import os
+import sys
 
-    Args:
-        obj (object): The object to be checked.
-        class_name (str): The name of the class to compare against.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-    Returns:
-        bool: True if the object's class name matches class_name,
-              False otherwise.
-    """
-    if obj is None:
-        return False
-    return obj.__class__.__name__ == class_name
+from garden import lower_name, obj_in_class  # noqa: E402
 
 
 def water_plants(plant_list: list[str]) -> None:
@@ -38,7 +31,7 @@ def water_plants(plant_list: list[str]) -> None:
             )
         if plant == "":
             raise ValueError("The plant name cannot be empty")
-        print(f"Watering {plant.lower()}")
+        print(f"Watering {lower_name(plant)}")
 
 
 def test_watering_system() -> None:
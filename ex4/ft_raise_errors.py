@@ -1,18 +1,67 @@
-def obj_in_class(obj: object, class_name: str) -> bool:
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from garden import (  # noqa: E402
+    VERDICT_SUNLIGHT_HOURS,
+    VERDICT_WATER_LEVELS,
+    lower_name,
+    obj_in_class,
+)
+
+_ALERTS: dict[tuple[int, int], str | None] = {}
+_UNKNOWN = object()
+
+
+def _compute_alert(water_level: int, sunlight_hours: int) -> str | None:
+    """Compute the alert of environment_alert without the memo."""
+    if water_level > 10:
+        return (f"Irrigation Alert: Water level {water_level} exceeds "
+                "maximum safety threshold (10).")
+    if water_level < 1:
+        return (f"Irrigation Alert: Water level {water_level} is below "
+                "minimum hydration requirements (1).")
+
+    if sunlight_hours > 12:
+        return (f"Exposure Alert: Sunlight duration {sunlight_hours}h "
+                "exceeds safe metabolic limit (12h).")
+    if sunlight_hours < 2:
+        return (f"Exposure Alert: Sunlight duration {sunlight_hours}h is "
+                "insufficient for photosynthesis (min 2h).")
+    return None
+
+
+def environment_alert(water_level: int, sunlight_hours: int) -> str | None:
     """
-    Check if an object is an instance of a specific class by its name.
+    Return the alert for unsafe environmental conditions.
+
+    The alert depends only on the two readings, so it is stored in a
+    table the first time a pair is seen, like garden's health_verdict: only
+    int pairs inside VERDICT_WATER_LEVELS and VERDICT_SUNLIGHT_HOURS are
+    stored, and other readings (out of range, floats, bools) are computed
+    on every call. A plain dict is used rather than functools.lru_cache,
+    whose import would dominate the start-up of this script.
 
     Args:
-        obj (object): The object to be checked.
-        class_name (str): The name of the class to compare against.
+        water_level (int): Current water level (scale 1-10).
+        sunlight_hours (int): Daily sunlight exposure (hours 2-12).
 
     Returns:
-        bool: True if the object's class name matches class_name,
-              False otherwise.
+        str | None: The alert message, or None if the conditions are safe.
     """
-    if obj is None:
-        return False
-    return obj.__class__.__name__ == class_name
+    if type(water_level) is not int or type(sunlight_hours) is not int:
+        return _compute_alert(water_level, sunlight_hours)
+    alert = _ALERTS.get((water_level, sunlight_hours), _UNKNOWN)
+    if alert is not _UNKNOWN:
+        return alert
+    alert = _compute_alert(water_level, sunlight_hours)
+    if (water_level in VERDICT_WATER_LEVELS
+            and sunlight_hours in VERDICT_SUNLIGHT_HOURS):
+        _ALERTS[water_level, sunlight_hours] = alert
+    return alert
 
 
 def check_plant_health(
@@ -39,29 +88,11 @@ def check_plant_health(
     if plant_name == "":
         raise ValueError("Invalid Input: Plant name cannot be empty.")
 
-    if water_level > 10:
-        raise ValueError(
-            f"Irrigation Alert: Water level {water_level} exceeds "
-            "maximum safety threshold (10)."
-        )
-    if water_level < 1:
-        raise ValueError(
-            f"Irrigation Alert: Water level {water_level} is below "
-            "minimum hydration requirements (1)."
-        )
-
-    if sunlight_hours > 12:
-        raise ValueError(
-            f"Exposure Alert: Sunlight duration {sunlight_hours}h exceeds "
-            "safe metabolic limit (12h)."
-        )
-    if sunlight_hours < 2:
-        raise ValueError(
-            f"Exposure Alert: Sunlight duration {sunlight_hours}h is "
-            "insufficient for photosynthesis (min 2h)."
-        )
+    alert = environment_alert(water_level, sunlight_hours)
+    if alert is not None:
+        raise ValueError(alert)
 
-    print(f"Plant '{plant_name.lower()}' is healthy!", end="\n\n")
+    print(f"Plant '{lower_name(plant_name)}' is healthy!", end="\n\n")
 
 
 def test_plant_checks() -> None:
@@ -1,81 +1,15 @@
-class GardenError(Exception):
-    """Base class for all garden-related errors."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: GardenError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class PlantError(GardenError):
-    """Raised when there is an issue with a plant."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: PlantError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class WaterError(GardenError):
-    """Raised when there is a watering or irrigation issue."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: WaterError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class SunLightError(GardenError):
-    """Raised when there is a sunlight exposure issue."""
-    def __init__(
-        self,
-        messege: str = "An error of the following type occurred: SunLightError"
-    ) -> None:
-        super().__init__(messege)
-
-
-class Plant:
-    """
-    A class representing a plant with physiological and environmental data.
+import os
+import sys
 
-    Attributes:
-        name (str): The common name of the plant.
-        height (int): The current height of the plant in centimeters.
-        age (int): The age of the plant in days.
-        water_level (int): The current hydration level of the plant.
-        sunlight_hours (int): Daily sunlight exposure in hours.
-    """
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-    def __init__(
-            self, name: str, height: int, age: int,
-            water_level: int, sunlight_hours: int
-    ) -> None:
-        """Initialize plant and validate biological and environmental data."""
-        if not obj_in_class(name, "str"):
-            raise TypeError(f"Type Error: 'name' must be a string, not "
-                            f"'{name.__class__.__name__}'.")
-        if name == "":
-            raise PlantError("Identification Error: Plant name cannot be "
-                             "empty.")
-        if (age == 0 and height > 0) or (age > 0 and height == 0):
-            raise PlantError(f"Biological Mismatch: Inconsistent age ({age}) "
-                             f"and height ({height}) relationship.")
-        if age < 0:
-            raise PlantError(f"Value Error: Age cannot be negative ({age}).")
-        if height < 0:
-            raise PlantError(f"Value Error: Height cannot be negative "
-                             f"({height}).")
-        if water_level < 0:
-            raise WaterError(f"Hydration Error: Water level cannot be "
-                             f"negative ({water_level}).")
-        if sunlight_hours < 0:
-            raise SunLightError(f"Photosynthesis Error: Sunlight hours "
-                                f"cannot be negative ({sunlight_hours}).")
-        self.name = name.capitalize()
-        self.age = age
-        self.height = height
-        self.water_level = water_level
-        self.sunlight_hours = sunlight_hours
+from garden import (  # noqa: E402,F401
+    GardenError, Plant, PlantError, SunLightError, WaterError,
+    canonical_name, check_environment, health_verdict, lower_name,
+    obj_in_class, validate_plant
+)
 
 
 class GardenManager:
@@ -86,6 +20,8 @@ class GardenManager:
         name (str): The name of the garden.
         owner (str): The owner of the garden.
         water_stock (int): Available units of water in the tank.
+        feed (ChangeFeed | None): Where mutations are published for a
+            follower, if the garden is replicated.
     """
 
     def __init__(self, name: str, owner: str, water_stock: int) -> None:
@@ -101,21 +37,45 @@ class GardenManager:
         if water_stock < 0:
             raise WaterError(f"Inventory Error: Water stock cannot be "
                              f"negative ({water_stock}).")
-        self.name = name.capitalize()
-        self.owner = owner.capitalize()
+        self.name = canonical_name(name)
+        self.owner = canonical_name(owner)
         self.plants: list[Plant] = []
         self.number_plants = 0
         self.water_stock = water_stock
+        self.feed = None
 
     def add_plant(self, plant: Plant) -> None:
         """Add a validated Plant object to the garden collection."""
         if not obj_in_class(plant, "Plant"):
             raise TypeError(f"Type Error: Expected 'Plant' object, got "
                             f"'{plant.__class__.__name__}'.")
+        if self.feed is not None:
+            self.feed.plant_added(plant)
         self.plants.append(plant)
         self.number_plants += 1
         print(f"Success: {plant.name} added to {self.name}.")
 
+    def update_plant(self, index: int, attribute: str, value: int) -> None:
+        """Change one measurement of a plant, keeping the plant valid."""
+        if not 0 <= index < len(self.plants):
+            raise PlantError(f"Registry Error: No plant at position "
+                             f"{index}.")
+        plant = self.plants[index]
+        values = {
+            "height": plant.height,
+            "age": plant.age,
+            "water_level": plant.water_level,
+            "sunlight_hours": plant.sunlight_hours,
+        }
+        if attribute not in values:
+            raise PlantError(f"Update Error: '{attribute}' is not a plant "
+                             "measurement.")
+        values[attribute] = value
+        validate_plant(plant.name, **values)
+        if self.feed is not None:
+            self.feed.plant_updated(index, attribute, value)
+        setattr(plant, attribute, value)
+
     def water_plants(self) -> None:
         """Execute irrigation for all plants if resources permit."""
         print("Opening watering system...")
@@ -123,10 +83,21 @@ class GardenManager:
             raise WaterError(f"Resource Scarcity: Tank level "
                              f"({self.water_stock}) is below required "
                              f"amount ({len(self.plants)}).")
+        if self.feed is not None and self.plants:
+            self.feed.water_changed(-len(self.plants))
         for plant in self.plants:
             print(f"Irrigating {plant.name} - OK")
             self.water_stock -= 1
 
+    def add_water(self, units: int) -> None:
+        """Refill the water tank with the given units."""
+        if units <= 0:
+            raise WaterError(f"Inventory Error: Refill must be positive "
+                             f"({units}).")
+        if self.feed is not None:
+            self.feed.water_changed(units)
+        self.water_stock += units
+
     def check_water_tank(self) -> None:
         """Validate if current water reserves meet the minimum threshold."""
         if self.water_stock < self.number_plants:
@@ -135,48 +106,14 @@ class GardenManager:
 
     def check_plant_health(self) -> None:
         """Perform a health diagnostic for every plant in the garden."""
-
-        def plants_is_health(water_level: int, sunlight_hours: int) -> None:
-            """Validate health parameters against environmental thresholds."""
-            if water_level > 10:
-                raise WaterError(f"Oversaturation: Water level {water_level} "
-                                 "exceeds safety limit (max 10).")
-            if water_level < 1:
-                raise WaterError(f"Dehydration: Water level {water_level} "
-                                 "is below survival limit (min 1).")
-            if sunlight_hours > 12:
-                raise SunLightError(f"Overexposure: {sunlight_hours}h "
-                                    "sunlight exceeds limit (max 12h).")
-            if sunlight_hours < 2:
-                raise SunLightError(f"Light Deficiency: {sunlight_hours}h "
-                                    "is below metabolic limit (min 2h).")
-
         for plant in self.plants:
-            try:
-                plants_is_health(plant.water_level, plant.sunlight_hours)
-            except GardenError as error:
+            verdict = health_verdict(plant.water_level, plant.sunlight_hours)
+            if verdict is not None:
                 raise PlantError(f"Diagnostic Failure for {plant.name}: "
-                                 f"{error}")
-            else:
-                print(f"Status - {plant.name.lower()}: healthy "
-                      f"(H2O: {plant.water_level}, "
-                      f"UV: {plant.sunlight_hours})")
-
-
-def obj_in_class(obj: object, class_name: str) -> bool:
-    """
-    Check if an object is an instance of a specific class by its name.
-
-    Args:
-        obj (object): The object to verify.
-        class_name (str): The name of the class to check for.
-
-    Returns:
-        bool: True if class names match, False otherwise.
-    """
-    if obj is None:
-        return False
-    return obj.__class__.__name__ == class_name
+                                 f"{verdict[1]}")
+            print(f"Status - {lower_name(plant.name)}: healthy "
+                  f"(H2O: {plant.water_level}, "
+                  f"UV: {plant.sunlight_hours})")
 
 
 def test_garden_management() -> None:
@@ -0,0 +1,47 @@
+_EXPORTS: dict[str, str] = {
+    "GardenError": "errors",
+    "PlantError": "errors",
+    "WaterError": "errors",
+    "SunLightError": "errors",
+    "Plant": "plant",
+    "obj_in_class": "validation",
+    "validate_plant": "validation",
+    "check_environment": "validation",
+    "health_verdict": "validation",
+    "group_by_verdict": "validation",
+    "VERDICT_WATER_LEVELS": "validation",
+    "VERDICT_SUNLIGHT_HOURS": "validation",
+    "canonical_name": "names",
+    "lower_name": "names",
+    "ChangeFeed": "replication",
+    "Follower": "replication",
+    "GardenReplica": "replication",
+    "follow": "replication",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the submodule that defines a public name on first access.
+
+    Only the submodules an exercise actually uses are loaded: ex3 and ex4
+    never load garden.plant or garden.replication. The builtin __import__
+    is used because importing importlib would cost more than it saves.
+
+    Args:
+        name (str): The attribute looked up on the package.
+
+    Returns:
+        object: The public class or function of that name.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module = __import__(f"{__name__}.{_EXPORTS[name]}", fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,347 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from multiprocessing import Pool
+from typing import Iterator, TextIO
+
+from .errors import GardenError, WaterError
+from .plant import Plant
+from .validation import health_verdict
+
+
+def read_chunks(
+        stream: TextIO, chunk_size: int, first_line: int = 1
+) -> Iterator[tuple[list[int], list[str]]]:
+    """
+    Split an inventory into chunks of raw lines, skipping blank ones.
+
+    Lines are parsed by the workers, so each record must fit on one line.
+
+    Args:
+        stream (TextIO): The opened inventory file.
+        chunk_size (int): Maximum number of lines per chunk.
+        first_line (int): File line number of the next line in stream.
+
+    Yields:
+        tuple: The file line numbers and the lines of one chunk.
+    """
+    numbers: list[int] = []
+    chunk: list[str] = []
+    for number, line in enumerate(stream, first_line):
+        if not line.strip():
+            continue
+        numbers.append(number)
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield numbers, chunk
+            numbers, chunk = [], []
+    if chunk:
+        yield numbers, chunk
+
+
+def read_int(record: dict, field: str) -> int:
+    """
+    Read an integer field the same way for CSV and JSON records.
+
+    Args:
+        record (dict): The parsed record.
+        field (str): The name of the field.
+
+    Returns:
+        int: The value, from an int or from a string of digits.
+
+    Raises:
+        KeyError: If the field is missing.
+        ValueError: If a string value is not an integer.
+        TypeError: If the value is neither an int nor a string, which
+            rejects JSON floats and booleans instead of truncating them.
+    """
+    value = record[field]
+    if type(value) is int:
+        return value
+    if type(value) is str:
+        return int(value)
+    raise TypeError(f"Type Error: '{field}' must be an integer, not "
+                    f"'{value.__class__.__name__}'.")
+
+
+def read_row(line: str, header: list[str]) -> dict:
+    """
+    Parse one CSV line and map its fields to the header.
+
+    Each line is parsed on its own, so a malformed line cannot swallow the
+    lines after it.
+
+    Args:
+        line (str): One raw line of the inventory.
+        header (list[str]): The field names from the first line.
+
+    Returns:
+        dict: The fields of the line, keyed by field name.
+
+    Raises:
+        ValueError: If the line is not valid CSV, such as an unterminated
+            quote or a field over the csv module's size limit.
+    """
+    try:
+        row = next(csv.reader([line], strict=True), [])
+    except csv.Error as error:
+        raise ValueError(f"Format Error: Malformed CSV line ({error}).")
+    return dict(zip(header, row))
+
+
+def load_plant(record: dict | str) -> Plant:
+    """
+    Build a validated Plant from one inventory record.
+
+    Args:
+        record (dict | str): A CSV row mapped to its header, or a JSON line.
+
+    Returns:
+        Plant: The plant, validated with the garden rules.
+
+    Raises:
+        ValueError: If the record is not valid JSON or a value is not an int.
+        RecursionError: If a JSON line is nested too deeply to parse.
+        KeyError: If a required field is missing.
+        TypeError: If the name is not a string or a value has a wrong type.
+        GardenError: If the plant fails validation.
+    """
+    if isinstance(record, str):
+        record = json.loads(record)
+        if not isinstance(record, dict):
+            raise ValueError("Format Error: Each JSON line must be an "
+                             "object.")
+    return Plant(
+        record["name"], read_int(record, "height"), read_int(record, "age"),
+        read_int(record, "water_level"), read_int(record, "sunlight_hours")
+    )
+
+
+def process_chunk(
+        job: tuple[list[int], list[str], list[str] | None, int]
+) -> dict:
+    """
+    Validate and health-check the records of one chunk.
+
+    Args:
+        job (tuple): File line numbers of the records, the raw lines, the
+            CSV header (None for JSON lines) and the maximum number of error
+            samples to keep.
+
+    Returns:
+        dict: Counters for the chunk, mergeable with merge_results.
+    """
+    numbers, lines, header, max_samples = job
+    errors: Counter = Counter()
+    health: Counter = Counter()
+    samples: list[dict] = []
+    valid = 0
+
+    for row, line in zip(numbers, lines):
+        try:
+            record = line if header is None else read_row(line, header)
+            plant = load_plant(record)
+        except (GardenError, ValueError, KeyError, TypeError,
+                RecursionError) as error:
+            errors[error.__class__.__name__] += 1
+            if len(samples) < max_samples:
+                samples.append({
+                    "row": row,
+                    "error": error.__class__.__name__,
+                    "message": str(error),
+                })
+            continue
+        valid += 1
+        verdict = health_verdict(plant.water_level, plant.sunlight_hours)
+        health["healthy" if verdict is None else verdict[0].__name__] += 1
+
+    return {
+        "rows": len(lines),
+        "valid": valid,
+        "errors": errors,
+        "health": health,
+        "samples": samples,
+    }
+
+
+def merge_results(total: dict, part: dict, max_samples: int) -> None:
+    """Add the counters of one chunk result into the running total."""
+    total["rows"] += part["rows"]
+    total["valid"] += part["valid"]
+    total["errors"].update(part["errors"])
+    total["health"].update(part["health"])
+    room = max_samples - len(total["samples"])
+    total["samples"].extend(part["samples"][:room])
+
+
+def run_batch(
+        stream: TextIO, fmt: str, workers: int, chunk_size: int,
+        max_samples: int, progress: TextIO | None = None
+) -> dict:
+    """
+    Process an inventory with a pool of worker processes.
+
+    At most two chunks per worker are in flight at any time, so memory use
+    depends on chunk_size and workers, not on the size of the inventory.
+
+    Args:
+        stream (TextIO): The opened inventory file.
+        fmt (str): Either 'csv' or 'jsonl'.
+        workers (int): Number of worker processes, 1 runs in-process.
+        chunk_size (int): Number of records sent to a worker at once.
+        max_samples (int): Maximum number of error samples in the report.
+        progress (TextIO | None): Where to print progress, if anywhere.
+
+    Returns:
+        dict: The merged counters of every chunk.
+
+    Raises:
+        csv.Error: If the CSV header line is malformed.
+    """
+    total: dict = {
+        "rows": 0, "valid": 0, "errors": Counter(), "health": Counter(),
+        "samples": [],
+    }
+    start = time.perf_counter()
+    last_report = start
+
+    def collect(part: dict) -> None:
+        nonlocal last_report
+        merge_results(total, part, max_samples)
+        now = time.perf_counter()
+        if progress is not None and now - last_report >= 1:
+            last_report = now
+            print(f"Progress: {total['rows']} rows "
+                  f"({total['rows'] / (now - start):.0f} rows/s)",
+                  file=progress)
+
+    header = None
+    first_line = 1
+    if fmt == "csv":
+        header = next(csv.reader([stream.readline()], strict=True), [])
+        first_line = 2
+    jobs = (
+        (numbers, chunk, header, max_samples)
+        for numbers, chunk in read_chunks(stream, chunk_size, first_line)
+    )
+    if workers == 1:
+        for job in jobs:
+            collect(process_chunk(job))
+        return total
+
+    with Pool(workers) as pool:
+        pending: deque = deque()
+        for job in jobs:
+            pending.append(pool.apply_async(process_chunk, (job,)))
+            if len(pending) >= 2 * workers:
+                collect(pending.popleft().get())
+        while pending:
+            collect(pending.popleft().get())
+    return total
+
+
+def check_water_tank(water_stock: int, number_plants: int) -> dict:
+    """
+    Apply the garden water tank rule to the loaded inventory.
+
+    Returns:
+        dict: The tank status, with the WaterError message when too low.
+    """
+    status: dict = {
+        "water_stock": water_stock, "plants": number_plants, "ok": True,
+    }
+    if water_stock < number_plants:
+        status["ok"] = False
+        status["message"] = str(WaterError(
+            f"Critical Level: Low water reserves ({water_stock} units "
+            "remaining)."
+        ))
+    return status
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the batch runner command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m garden.batch",
+        description="Validate and health-check a garden inventory."
+    )
+    parser.add_argument("inventory", help="CSV or JSON-lines plant records")
+    parser.add_argument(
+        "--format", choices=["csv", "jsonl"], default=None,
+        help="input format (default: guessed from the file extension)"
+    )
+    parser.add_argument(
+        "--water-stock", type=int, default=0,
+        help="units of water available in the tank"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="worker processes (default: number of CPUs)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--max-errors", type=int, default=20,
+                        help="number of error samples kept in the report")
+    parser.add_argument("--output", default=None,
+                        help="report file (default: standard output)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="do not print progress")
+    args = parser.parse_args(argv)
+    if args.format is None:
+        args.format = "csv" if args.inventory.endswith(".csv") else "jsonl"
+    if args.workers < 1 or args.chunk_size < 1 or args.max_errors < 0:
+        parser.error("--workers and --chunk-size must be >= 1, "
+                     "--max-errors >= 0")
+    if args.water_stock < 0:
+        parser.error(f"Inventory Error: Water stock cannot be negative "
+                     f"({args.water_stock}).")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the batch and write the report, returning the exit status."""
+    args = parse_args(argv)
+    progress = None if args.quiet else sys.stderr
+
+    start = time.perf_counter()
+    try:
+        with open(args.inventory, newline="",
+                  encoding="utf-8-sig") as stream:
+            total = run_batch(stream, args.format, args.workers,
+                              args.chunk_size, args.max_errors, progress)
+    except (OSError, UnicodeDecodeError, csv.Error) as error:
+        print(f"Batch Error: {error}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "inventory": args.inventory,
+        "format": args.format,
+        "rows": total["rows"],
+        "valid": total["valid"],
+        "invalid": total["rows"] - total["valid"],
+        "errors": dict(total["errors"]),
+        "error_samples": total["samples"],
+        "health": dict(total["health"]),
+        "water_tank": check_water_tank(args.water_stock, total["valid"]),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(total["rows"] / elapsed) if elapsed else 0,
+    }
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as output:
+            output.write(text)
+    if progress is not None:
+        print(f"Done: {report['rows']} rows in {report['elapsed_seconds']}s "
+              f"({report['rows_per_second']} rows/s)", file=progress)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+class GardenError(Exception):
+    """Base class for all garden-related errors."""
+    def __init__(
+        self,
+        messege: str = "An error of the following type occurred: GardenError"
+    ) -> None:
+        super().__init__(messege)
+
+
+class PlantError(GardenError):
+    """Raised when there is an issue with a plant."""
+    def __init__(
+        self,
+        messege: str = "An error of the following type occurred: PlantError"
+    ) -> None:
+        super().__init__(messege)
+
+
+class WaterError(GardenError):
+    """Raised when there is a watering or irrigation issue."""
+    def __init__(
+        self,
+        messege: str = "An error of the following type occurred: WaterError"
+    ) -> None:
+        super().__init__(messege)
+
+
+class SunLightError(GardenError):
+    """Raised when there is a sunlight exposure issue."""
+    def __init__(
+        self,
+        messege: str = "An error of the following type occurred: SunLightError"
+    ) -> None:
+        super().__init__(messege)
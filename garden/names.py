@@ -0,0 +1,74 @@
+NAME_CACHE_SIZE = 4096
+
+# Each table is a pair of generations, [current, old]. New entries go into
+# the current generation. Once it holds half of NAME_CACHE_SIZE entries it
+# becomes the old one and the previous old generation is dropped as a
+# whole, which is far cheaper than deleting entries one by one.
+_CANONICAL_BY_RAW: list[dict[str, str]] = [{}, {}]
+_CANONICAL: list[dict[str, str]] = [{}, {}]
+_LOWER_BY_RAW: list[dict[str, str]] = [{}, {}]
+_LOWER: list[dict[str, str]] = [{}, {}]
+
+
+def _remember(table: list[dict[str, str]], key: str, value: str) -> str:
+    """Store value under key, swapping generations when table is full."""
+    current = table[0]
+    if len(current) >= NAME_CACHE_SIZE // 2:
+        table[1] = current
+        table[0] = current = {}
+    current[key] = value
+    return value
+
+
+def _shared(table: list[dict[str, str]], text: str) -> str:
+    """Return the one stored string equal to text, storing text if new."""
+    shared = table[0].get(text)
+    if shared is None:
+        shared = _remember(table, text, table[1].get(text, text))
+    return shared
+
+
+def canonical_name(name: str) -> str:
+    """
+    Return the capitalized form of a plant, garden or owner name.
+
+    Two bounded tables act as an intern table: the first maps each raw
+    spelling to its capitalized form, the second keeps one string object
+    per capitalized form. "tomato", "TOMATO" and "Tomato" therefore all
+    return the same "Tomato" object. Each table holds at most
+    NAME_CACHE_SIZE names and drops its older half when full, so an
+    unbounded vocabulary costs a few dict stores per name. sys.intern is
+    not used because interned strings can outlive the tables.
+
+    Args:
+        name (str): The name as typed or read from a file.
+
+    Returns:
+        str: The shared capitalized name.
+    """
+    canonical = _CANONICAL_BY_RAW[0].get(name)
+    if canonical is None:
+        canonical = _CANONICAL_BY_RAW[1].get(name)
+        if canonical is None:
+            canonical = _shared(_CANONICAL, name.capitalize())
+        _remember(_CANONICAL_BY_RAW, name, canonical)
+    return canonical
+
+
+def lower_name(name: str) -> str:
+    """
+    Return the lowercase form of a name used in status messages.
+
+    Args:
+        name (str): The name to lower.
+
+    Returns:
+        str: The shared lowercase name, stored like canonical_name.
+    """
+    lower = _LOWER_BY_RAW[0].get(name)
+    if lower is None:
+        lower = _LOWER_BY_RAW[1].get(name)
+        if lower is None:
+            lower = _shared(_LOWER, name.lower())
+        _remember(_LOWER_BY_RAW, name, lower)
+    return lower
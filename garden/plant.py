@@ -0,0 +1,34 @@
+from .errors import PlantError
+from .names import canonical_name, lower_name
+from .validation import validate_plant
+
+
+class Plant:
+    """
+    A class representing a plant with physiological and environmental data.
+
+    Attributes:
+        name (str): The common name of the plant.
+        height (int): The current height of the plant in centimeters.
+        age (int): The age of the plant in days.
+        water_level (int): The current hydration level of the plant.
+        sunlight_hours (int): Daily sunlight exposure in hours.
+    """
+
+    def __init__(
+            self, name: str, height: int, age: int,
+            water_level: int = 0, sunlight_hours: int = 0
+    ) -> None:
+        """Initialize plant and validate biological and environmental data."""
+        validate_plant(name, height, age, water_level, sunlight_hours)
+        self.name = canonical_name(name)
+        self.age = age
+        self.height = height
+        self.water_level = water_level
+        self.sunlight_hours = sunlight_hours
+
+    def check_plant_health(self, is_wilting: bool) -> None:
+        """Check if the plant shows signs of distress."""
+        if is_wilting:
+            raise PlantError(f"Health Alert: The {lower_name(self.name)} "
+                             "is wilting! Immediate care required.")
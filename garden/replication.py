@@ -0,0 +1,348 @@
+import struct
+import threading
+import time
+from typing import Callable
+
+from .errors import GardenError
+from .plant import Plant
+
+OP_ADD = 1
+OP_UPDATE = 2
+OP_WATER = 3
+
+ATTRIBUTES: list[str] = ["height", "age", "water_level", "sunlight_hours"]
+
+_BATCH = struct.Struct("<QI")
+_ADD = struct.Struct("<BH")
+_ADD_VALUES = struct.Struct("<qqqq")
+_UPDATE = struct.Struct("<BIBq")
+_WATER = struct.Struct("<Bq")
+_ACK = struct.Struct("<Qqq")
+_MAX_NAME = 0xFFFF
+
+
+def _pack(layout: struct.Struct, *values: int) -> bytes:
+    """
+    Encode int values with layout, rejecting anything else.
+
+    Raises:
+        GardenError: If a value is not an int (floats and bools included)
+            or does not fit in its field.
+    """
+    for value in values:
+        if type(value) is not int:
+            raise GardenError(f"Replication Error: Only int values can be "
+                              f"replicated, not '{value.__class__.__name__}' "
+                              f"({value!r}).")
+    try:
+        return layout.pack(*values)
+    except struct.error:
+        raise GardenError(f"Replication Error: Value out of range in "
+                          f"{values}.")
+
+
+class GardenReplica:
+    """
+    The garden state a follower keeps in sync with its leader.
+
+    Attributes:
+        plants (list[Plant]): The replicated plants, in insertion order.
+        number_plants (int): Number of replicated plants.
+        water_stock (int): Replicated units of water in the tank.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty replica, filled by the leader's snapshot."""
+        self.plants: list[Plant] = []
+        self.number_plants = 0
+        self.water_stock = 0
+
+
+class ChangeFeed:
+    """
+    Encode garden mutations and send them to a follower in batches.
+
+    A batch is sent once it holds max_batch mutations, or by a background
+    thread once its oldest mutation is max_delay seconds old, so the lag
+    stays bounded even when the leader goes idle. A mutation is encoded
+    before it is buffered: a value that cannot be encoded raises a
+    GardenError and leaves the feed unchanged, so the leader should
+    publish a change before applying it to its own state.
+
+    If send fails, in any thread, the feed stops: the error is kept and
+    every later call raises it as a GardenError.
+
+    Attributes:
+        sequence (int): Number of mutations recorded so far.
+    """
+
+    def __init__(
+            self, send: Callable[[bytes], None],
+            max_batch: int = 1024, max_delay: float = 0.005
+    ) -> None:
+        """
+        Initialize the feed and start its flusher thread.
+
+        Args:
+            send (Callable): Called with each encoded batch, for instance
+                the send_bytes method of a multiprocessing Connection.
+            max_batch (int): Maximum number of mutations per batch.
+            max_delay (float): Maximum age in seconds of a buffered
+                mutation before its batch is sent.
+        """
+        if max_batch < 1:
+            raise GardenError(f"Replication Error: Batch size must be "
+                              f"positive ({max_batch}).")
+        if max_delay <= 0:
+            raise GardenError(f"Replication Error: Delay must be positive "
+                              f"({max_delay}).")
+        self.send = send
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.sequence = 0
+        self._pieces: list[bytes] = []
+        self._oldest = 0.0
+        self._closed = False
+        self._error: Exception | None = None
+        self._lock = threading.Condition()
+        self._flusher = threading.Thread(
+            target=self._flush_when_due, name="garden-feed-flusher",
+            daemon=True
+        )
+        self._flusher.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of mutations recorded but not sent yet."""
+        return len(self._pieces)
+
+    def plant_added(self, plant: Plant) -> None:
+        """Record a plant appended to the garden."""
+        name = plant.name.encode()
+        if len(name) > _MAX_NAME:
+            raise GardenError(f"Replication Error: Plant name is too long "
+                              f"({len(name)} bytes, max {_MAX_NAME}).")
+        self._record(_pack(_ADD, OP_ADD, len(name)) + name + _pack(
+            _ADD_VALUES, plant.height, plant.age, plant.water_level,
+            plant.sunlight_hours
+        ))
+
+    def plant_updated(self, index: int, attribute: str, value: int) -> None:
+        """Record a new value for one measurement of the plant at index."""
+        if attribute not in ATTRIBUTES:
+            raise GardenError(f"Replication Error: '{attribute}' is not a "
+                              "replicated plant attribute.")
+        self._record(_pack(
+            _UPDATE, OP_UPDATE, index, ATTRIBUTES.index(attribute), value
+        ))
+
+    def water_changed(self, delta: int) -> None:
+        """Record units of water added to (or taken from) the tank."""
+        self._record(_pack(_WATER, OP_WATER, delta))
+
+    def snapshot(self, garden: object) -> None:
+        """
+        Record the whole state of a garden, to bootstrap a new follower.
+
+        Args:
+            garden (object): A garden with plants and water_stock.
+        """
+        for plant in garden.plants:
+            self.plant_added(plant)
+        self.water_changed(garden.water_stock)
+
+    def flush(self) -> None:
+        """
+        Send the buffered mutations, if any, as one batch.
+
+        Raises:
+            GardenError: If this or an earlier batch could not be sent.
+        """
+        with self._lock:
+            self._flush()
+            self._raise_error()
+
+    def close(self) -> None:
+        """
+        Flush, stop the flusher and send the batch that stops the follower.
+
+        Raises:
+            GardenError: If a batch could not be sent.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+            self._lock.notify()
+        self._flusher.join()
+        with self._lock:
+            if self._error is None:
+                self._send(b"")
+            self._raise_error()
+
+    def _record(self, piece: bytes) -> None:
+        """Buffer one encoded mutation and send the batch when it is full."""
+        with self._lock:
+            self._raise_error()
+            if self._closed:
+                raise GardenError("Replication Error: The feed is closed.")
+            if not self._pieces:
+                self._oldest = time.monotonic()
+                self._lock.notify()
+            self._pieces.append(piece)
+            self.sequence += 1
+            if len(self._pieces) >= self.max_batch:
+                self._flush()
+                self._raise_error()
+
+    def _raise_error(self) -> None:
+        """Raise the error that stopped the feed, if any."""
+        if self._error is not None:
+            raise GardenError(f"Replication Error: Could not send a batch "
+                              f"({self._error!r}).") from self._error
+
+    def _send(self, data: bytes) -> None:
+        """Send data, keeping the error instead of raising it."""
+        try:
+            self.send(data)
+        except Exception as error:
+            self._error = error
+            self._lock.notify()
+
+    def _flush(self) -> None:
+        """Send the buffered mutations; the caller holds the lock."""
+        if not self._pieces or self._error is not None:
+            return
+        first = self.sequence - len(self._pieces) + 1
+        data = _BATCH.pack(first, len(self._pieces)) + b"".join(self._pieces)
+        self._pieces = []
+        self._send(data)
+
+    def _flush_when_due(self) -> None:
+        """Flusher thread: send each batch once its oldest entry is due."""
+        with self._lock:
+            while not self._closed and self._error is None:
+                if not self._pieces:
+                    self._lock.wait()
+                    continue
+                remaining = self._oldest + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                else:
+                    self._flush()
+
+
+class Follower:
+    """
+    Apply the batches of a ChangeFeed to a local garden.
+
+    Attributes:
+        garden (object): The garden kept in sync, a GardenReplica by
+            default.
+        sequence (int): Sequence number of the last applied mutation.
+    """
+
+    def __init__(self, garden: object | None = None) -> None:
+        """Initialize the follower with the garden to keep in sync."""
+        self.garden = GardenReplica() if garden is None else garden
+        self.sequence = 0
+
+    def apply(self, data: bytes) -> int:
+        """
+        Decode one batch and apply its mutations in order.
+
+        Args:
+            data (bytes): A batch produced by ChangeFeed.
+
+        Returns:
+            int: The sequence number of the last applied mutation.
+
+        Raises:
+            GardenError: If a batch is missing or the data is corrupt. The
+                mutations decoded before the corrupt one stay applied, so
+                the follower must be rebuilt from a new snapshot.
+        """
+        try:
+            first, count = _BATCH.unpack_from(data)
+        except struct.error as error:
+            raise GardenError(f"Replication Error: Corrupt batch "
+                              f"({error}).")
+        if first != self.sequence + 1:
+            raise GardenError(f"Replication Error: Expected mutation "
+                              f"{self.sequence + 1}, received {first}.")
+        try:
+            self._apply_mutations(data, count)
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise GardenError(f"Replication Error: Corrupt batch "
+                              f"{first} ({error}).")
+        self.sequence = first + count - 1
+        return self.sequence
+
+    def _apply_mutations(self, data: bytes, count: int) -> None:
+        """Decode and apply the count mutations that follow the header."""
+        garden = self.garden
+        offset = _BATCH.size
+        for _ in range(count):
+            op = data[offset]
+            if op == OP_UPDATE:
+                _, index, code, value = _UPDATE.unpack_from(data, offset)
+                setattr(garden.plants[index], ATTRIBUTES[code], value)
+                offset += _UPDATE.size
+            elif op == OP_WATER:
+                garden.water_stock += _WATER.unpack_from(data, offset)[1]
+                offset += _WATER.size
+            elif op == OP_ADD:
+                length = _ADD.unpack_from(data, offset)[1]
+                offset += _ADD.size
+                if offset + length > len(data):
+                    raise IndexError("plant name runs past the batch")
+                name = data[offset:offset + length].decode()
+                offset += length
+                garden.plants.append(
+                    Plant(name, *_ADD_VALUES.unpack_from(data, offset))
+                )
+                garden.number_plants += 1
+                offset += _ADD_VALUES.size
+            else:
+                raise GardenError(f"Replication Error: Unknown operation "
+                                  f"code {op}.")
+
+
+def follow(
+        conn: object, garden: object | None = None, ack: bool = False
+) -> None:
+    """
+    Keep a garden in sync with the batches received on a connection.
+
+    It stops on the empty batch sent by ChangeFeed.close(). With ack, the
+    follower acknowledges each batch with its sequence number, plant count
+    and water stock, so the leader can measure lag and check the state.
+    The leader must then read every acknowledgement as it arrives (read_ack
+    in a thread of its own, for instance): unread ones fill the connection,
+    the follower blocks and stops reading, and the leader blocks in turn.
+
+    Args:
+        conn (object): A multiprocessing Connection, from a Pipe or from
+            multiprocessing.connection for a local socket.
+        garden (object | None): The garden to update, a new GardenReplica
+            by default.
+        ack (bool): Whether to acknowledge each batch.
+    """
+    follower = Follower(garden)
+    while True:
+        data = conn.recv_bytes()
+        if not data:
+            break
+        sequence = follower.apply(data)
+        if ack:
+            conn.send_bytes(_ACK.pack(
+                sequence, follower.garden.number_plants,
+                follower.garden.water_stock
+            ))
+    conn.close()
+
+
+def read_ack(data: bytes) -> tuple[int, int, int]:
+    """Decode a follower acknowledgement into (sequence, plants, water)."""
+    return _ACK.unpack(data)
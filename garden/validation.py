@@ -0,0 +1,157 @@
+from .errors import GardenError, PlantError, SunLightError, WaterError
+
+VERDICT_WATER_LEVELS = range(0, 32)
+VERDICT_SUNLIGHT_HOURS = range(0, 25)
+
+_VERDICTS: dict[tuple[int, int], tuple[type[GardenError], str] | None] = {}
+_UNKNOWN = object()
+
+
+def obj_in_class(obj: object, class_name: str) -> bool:
+    """
+    Check if an object is an instance of a specific class by its name.
+
+    Args:
+        obj (object): The object to be checked.
+        class_name (str): The name of the class to compare against.
+
+    Returns:
+        bool: True if the object's class name matches class_name,
+              False otherwise.
+    """
+    if obj is None:
+        return False
+    return obj.__class__.__name__ == class_name
+
+
+def validate_plant(
+        name: str, height: int, age: int,
+        water_level: int = 0, sunlight_hours: int = 0
+) -> None:
+    """
+    Validate the biological and environmental data of a plant.
+
+    Args:
+        name (str): The common name of the plant.
+        height (int): The height of the plant in centimeters.
+        age (int): The age of the plant in days.
+        water_level (int, optional): The current hydration level.
+        sunlight_hours (int, optional): Daily sunlight exposure in hours.
+
+    Raises:
+        TypeError: If name is not a string.
+        PlantError: If the name is empty or age and height are invalid.
+        WaterError: If the water level is negative.
+        SunLightError: If the sunlight hours are negative.
+    """
+    if not obj_in_class(name, "str"):
+        raise TypeError(f"Type Error: 'name' must be a string, not "
+                        f"'{name.__class__.__name__}'.")
+    if name == "":
+        raise PlantError("Identification Error: Plant name cannot be "
+                         "empty.")
+    if (age == 0 and height > 0) or (age > 0 and height == 0):
+        raise PlantError(f"Biological Mismatch: Inconsistent age ({age}) "
+                         f"and height ({height}) relationship.")
+    if age < 0:
+        raise PlantError(f"Value Error: Age cannot be negative ({age}).")
+    if height < 0:
+        raise PlantError(f"Value Error: Height cannot be negative "
+                         f"({height}).")
+    if water_level < 0:
+        raise WaterError(f"Hydration Error: Water level cannot be "
+                         f"negative ({water_level}).")
+    if sunlight_hours < 0:
+        raise SunLightError(f"Photosynthesis Error: Sunlight hours "
+                            f"cannot be negative ({sunlight_hours}).")
+
+
+def _environment_verdict(
+        water_level: int, sunlight_hours: int
+) -> tuple[type[GardenError], str] | None:
+    """Compute the health verdict of health_verdict without the table."""
+    if water_level > 10:
+        return WaterError, (f"Oversaturation: Water level {water_level} "
+                            "exceeds safety limit (max 10).")
+    if water_level < 1:
+        return WaterError, (f"Dehydration: Water level {water_level} "
+                            "is below survival limit (min 1).")
+    if sunlight_hours > 12:
+        return SunLightError, (f"Overexposure: {sunlight_hours}h "
+                               "sunlight exceeds limit (max 12h).")
+    if sunlight_hours < 2:
+        return SunLightError, (f"Light Deficiency: {sunlight_hours}h "
+                               "is below metabolic limit (min 2h).")
+    return None
+
+
+def health_verdict(
+        water_level: int, sunlight_hours: int
+) -> tuple[type[GardenError], str] | None:
+    """
+    Look up the health verdict of a plant's environment.
+
+    The verdict depends only on the two readings, so it is stored in a
+    table the first time a pair is seen. Only int pairs inside
+    VERDICT_WATER_LEVELS and VERDICT_SUNLIGHT_HOURS are stored, so the
+    table stays bounded. Other pairs are computed on every call. Floats and
+    bools never read the table, since 0.0 == 0 and True == 1 would find an
+    int entry whose message shows a different value.
+
+    Args:
+        water_level (int): Current water level (safe range 1-10).
+        sunlight_hours (int): Daily sunlight exposure (safe range 2-12h).
+
+    Returns:
+        tuple | None: None if the plant is healthy, otherwise the error
+            class and message that check_environment raises.
+    """
+    if type(water_level) is not int or type(sunlight_hours) is not int:
+        return _environment_verdict(water_level, sunlight_hours)
+    verdict = _VERDICTS.get((water_level, sunlight_hours), _UNKNOWN)
+    if verdict is not _UNKNOWN:
+        return verdict
+    verdict = _environment_verdict(water_level, sunlight_hours)
+    if (water_level in VERDICT_WATER_LEVELS
+            and sunlight_hours in VERDICT_SUNLIGHT_HOURS):
+        _VERDICTS[water_level, sunlight_hours] = verdict
+    return verdict
+
+
+def check_environment(water_level: int, sunlight_hours: int) -> None:
+    """
+    Validate health parameters against environmental thresholds.
+
+    Args:
+        water_level (int): Current water level (safe range 1-10).
+        sunlight_hours (int): Daily sunlight exposure (safe range 2-12h).
+
+    Raises:
+        WaterError: If the water level is outside the safe range.
+        SunLightError: If the sunlight hours are outside the safe range.
+    """
+    verdict = health_verdict(water_level, sunlight_hours)
+    if verdict is not None:
+        error_class, message = verdict
+        raise error_class(message)
+
+
+def group_by_verdict(plants: list) -> dict[tuple | None, list]:
+    """
+    Group plants by the health verdict of their environment.
+
+    Args:
+        plants (list): Plants, or any objects with water_level and
+            sunlight_hours.
+
+    Returns:
+        dict: The plants for each verdict, None holding the healthy ones.
+    """
+    groups: dict[tuple | None, list] = {}
+    for plant in plants:
+        verdict = health_verdict(plant.water_level, plant.sunlight_hours)
+        group = groups.get(verdict)
+        if group is None:
+            group = groups[verdict] = []
+        group.append(plant)
+    return groups
@@ -0,0 +1,135 @@
+import os
+import sys
+import threading
+import unittest
+from multiprocessing import Pipe
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from garden import (  # noqa: E402
+    ChangeFeed,
+    Follower,
+    GardenError,
+    GardenReplica,
+    Plant,
+    follow,
+)
+from garden.replication import read_ack  # noqa: E402
+
+TIMEOUT = 30
+
+
+class ReplicationRoundTripTest(unittest.TestCase):
+    """Send batches through a real Pipe to a follower thread."""
+
+    def setUp(self) -> None:
+        """Start a follower on one end of a Pipe."""
+        self.leader, follower_end = Pipe()
+        self.replica = GardenReplica()
+        self.follower = threading.Thread(
+            target=follow, args=(follower_end, self.replica), daemon=True
+        )
+        self.follower.start()
+
+    def run_leader(self, target: object) -> None:
+        """Run target in a thread and fail instead of hanging."""
+        leader = threading.Thread(target=target, daemon=True)
+        leader.start()
+        leader.join(TIMEOUT)
+        self.assertFalse(leader.is_alive(), "the leader is blocked")
+
+    def test_many_batches_without_reading_acks(self) -> None:
+        feed = ChangeFeed(self.leader.send_bytes, max_batch=1)
+
+        def mutate() -> None:
+            feed.plant_added(Plant("rose", 10, 5, 3, 4))
+            for _ in range(12_000):
+                feed.water_changed(1)
+            feed.plant_updated(0, "water_level", 7)
+            feed.close()
+
+        self.run_leader(mutate)
+        self.follower.join(TIMEOUT)
+        self.assertFalse(self.follower.is_alive())
+        self.assertEqual(feed.sequence, 12_002)
+        self.assertEqual(self.replica.water_stock, 12_000)
+        self.assertEqual(self.replica.number_plants, 1)
+        self.assertEqual(self.replica.plants[0].water_level, 7)
+
+    def test_rejected_value_leaves_feed_unchanged(self) -> None:
+        feed = ChangeFeed(self.leader.send_bytes)
+        feed.water_changed(5)
+        for bad in (1.5, True, 2 ** 70):
+            with self.assertRaises(GardenError):
+                feed.water_changed(bad)
+        self.assertEqual(feed.sequence, 1)
+        self.run_leader(feed.close)
+        self.follower.join(TIMEOUT)
+        self.assertEqual(self.replica.water_stock, 5)
+
+
+class AcknowledgementTest(unittest.TestCase):
+    """Opt-in acknowledgements, read by a thread of the leader."""
+
+    def test_last_ack_matches_leader(self) -> None:
+        leader, follower_end = Pipe()
+        follower = threading.Thread(
+            target=follow, args=(follower_end, None, True), daemon=True
+        )
+        follower.start()
+        acks: list[tuple[int, int, int]] = []
+
+        def read_acks() -> None:
+            while True:
+                try:
+                    acks.append(read_ack(leader.recv_bytes()))
+                except EOFError:
+                    return
+
+        reader = threading.Thread(target=read_acks, daemon=True)
+        reader.start()
+        feed = ChangeFeed(leader.send_bytes, max_batch=1)
+        for _ in range(11_000):
+            feed.water_changed(2)
+        feed.close()
+        follower.join(TIMEOUT)
+        reader.join(TIMEOUT)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(acks[-1], (11_000, 0, 22_000))
+
+
+class FailureTest(unittest.TestCase):
+    """Corrupt batches and failed sends are reported as GardenError."""
+
+    def test_truncated_batch(self) -> None:
+        sent: list[bytes] = []
+        feed = ChangeFeed(sent.append)
+        feed.plant_added(Plant("rose", 10, 5, 3, 4))
+        feed.flush()
+        for data in (sent[0][:5], sent[0][:20], sent[0][:-3]):
+            with self.assertRaises(GardenError):
+                Follower().apply(data)
+        feed.close()
+
+    def test_send_error_in_flusher_is_raised_later(self) -> None:
+        failed = threading.Event()
+
+        def send(data: bytes) -> None:
+            failed.set()
+            raise BrokenPipeError("follower is gone")
+
+        feed = ChangeFeed(send, max_delay=0.001)
+        feed.water_changed(1)
+        self.assertTrue(failed.wait(TIMEOUT))
+        with self.assertRaises(GardenError):
+            feed.water_changed(1)
+        with self.assertRaises(GardenError):
+            feed.flush()
+        with self.assertRaises(GardenError):
+            feed.close()
+
+
+if __name__ == "__main__":
+    unittest.main()